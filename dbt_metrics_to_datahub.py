@@ -11,21 +11,38 @@ Usage:
                                       --token <your-token>
 
 Requirements:
-    pip install acryl-datahub
+    pip install -r requirements.txt
 """
 
 import argparse
-import json
+import functools
+import gzip
+import hashlib
 import logging
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
-
-from datahub.emitter.mce_builder import (
-    make_term_urn,
-    make_dataset_urn,
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
 )
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass
+from decimal import Decimal
+
+import ijson
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datahub.emitter.mce_builder import make_dataset_urn
 from datahub.emitter.mcp import MetadataChangeProposalWrapper
-from datahub.emitter.rest_emitter import DatahubRestEmitter
+from datahub.emitter.serialization_helper import pre_json_transform
 from datahub.metadata.schema_classes import (
     GlossaryTermInfoClass,
     GlossaryNodeInfoClass,
@@ -45,15 +62,154 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Manifest parsing is dominated by JSON tokenization; ijson already prefers its C (yajl2)
+# backend, so only point out when it had to fall back to a slower one
+if ijson.backend != 'yajl2_c':
+    logger.warning(f"ijson C backend not available, using slower '{ijson.backend}' backend")
+
+
+# Emission is network-bound, so oversubscribe the CPUs like ThreadPoolExecutor's own default
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Emit an INFO progress line every this many metrics; per-metric detail is DEBUG only
+PROGRESS_LOG_INTERVAL = 1000
+
+# gzip level 1 compresses verbose MCP JSON nearly as well as the default, several times faster
+GZIP_COMPRESSLEVEL = 1
+
+# Transient GMS responses worth retrying; batch ingestion is an idempotent UPSERT
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Below this manifest size, forking index workers costs more than the section passes they overlap
+PARALLEL_INDEX_MIN_BYTES = 16 * 1024 * 1024
+
+# Seconds to wait on each GMS request, the SDK emitter's default
+REQUEST_TIMEOUT_SEC = 30
+
+# GMS rejects request bodies above 15 MiB (the SDK emitter's INGEST_MAX_PAYLOAD_BYTES)
+INGEST_MAX_PAYLOAD_BYTES = 15 * 1024 * 1024
+
+# GMS answers 500 when a batch takes too long to process, so the SDK emitter never sends more
+# MCPs than this per request (its BATCH_INGEST_MAX_PAYLOAD_LENGTH)
+BATCH_INGEST_MAX_PAYLOAD_LENGTH = 200
+
+# MCPs queued per batch; the default already is the most GMS takes in one request
+DEFAULT_BATCH_SIZE = BATCH_INGEST_MAX_PAYLOAD_LENGTH
+
+
+# ijson parses non-integer numbers as Decimal (use_float would reject integers beyond
+# int64 anywhere in the manifest), so JSON output converts them back to floats
+def _dump_json(value) -> str:
+    """Serialize to a compact JSON string"""
+    return orjson.dumps(value, default=float).decode()
+
+
+def _floats_from_decimals(value):
+    """Recursively turn ijson's Decimals back into the floats json.load would have produced"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        return {key: _floats_from_decimals(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_floats_from_decimals(item) for item in value]
+    return value
+
+
+# (customProperties key, DBTMetric attribute, formatter), set only when the attribute is truthy
+METRIC_CUSTOM_PROPERTIES = (
+    ('metric_type', 'type', str),
+    ('calculation_method', 'calculation_method', str),
+    ('expression', 'expression', str),
+    ('dimensions', 'dimensions', ', '.join),
+    ('time_grains', 'time_grains', ', '.join),
+    ('filters', 'filters', _dump_json),
+    ('tags', 'tags', ', '.join),
+)
+
+
+# Manifest sections that hold lineage targets, the key holding each one's table name, and the
+# resource types (the leading part of a dbt unique_id) stored in that section
+NODE_SECTIONS = (
+    ('nodes', 'alias', ('model.', 'seed.', 'snapshot.', 'analysis.', 'test.', 'operation.', 'sql_operation.')),
+    ('sources', 'identifier', ('source.',)),
+)
+
+
+def aspect_digest(mcpw: MetadataChangeProposalWrapper) -> str:
+    """Stable hash of an MCP's aspect, used to skip re-emitting unchanged metadata"""
+    return hashlib.sha256(orjson.dumps(mcpw.aspect.to_obj(), default=float, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def normalize_gms_url(url: str) -> str:
+    """Normalize a GMS URL the way the SDK's fixup_gms_url does, including Acryl Cloud's /gms path"""
+    url = url.rstrip('/')
+    if 'acryl.io' in url:
+        url = url.replace('http://', 'https://', 1).removesuffix(':8080')
+        if url.endswith('acryl.io/api/gms'):
+            url = url.removesuffix('/api/gms') + '/gms'
+        elif url.endswith('acryl.io'):
+            url += '/gms'
+    return url
+
+
+def gms_error_message(response: requests.Response) -> str:
+    """Extract the error message GMS puts in a failed response's JSON body"""
+    try:
+        return response.json().get('message') or response.reason
+    except (ValueError, AttributeError):
+        return response.reason
+
 
 def make_glossary_node_urn(node_name: str) -> str:
     """Create a GlossaryNode URN from a node name"""
     return f"urn:li:glossaryNode:{node_name}"
 
 
-@dataclass
+def make_node_dataset_urn(platform: str, env: str, database: str, schema: str, identifier: str) -> str:
+    """Build the DataHub dataset URN for a dbt model or source"""
+    # Build dataset name: database.schema.table
+    dataset_name = f"{database}.{schema}.{identifier}".lower()
+    return make_dataset_urn(
+        platform=platform,
+        name=dataset_name,
+        env=env
+    )
+
+
+def build_node_urn_index(
+    manifest_path: str,
+    section: str,
+    identifier_key: str,
+    platform: str,
+    env: str,
+    node_ids: Set[str]
+) -> Dict[str, str]:
+    """Stream one manifest section into a node_id -> dataset URN dict (may run in a worker process).
+
+    Only nodes in node_ids are kept, so the index is sized by what metrics reference, not the project.
+    The pass stops as soon as all of them are found instead of tokenizing the rest of the manifest.
+    """
+    node_index = {}
+    with open(manifest_path, 'rb') as f:
+        for node_id, node in ijson.kvitems(f, section):
+            if node_id not in node_ids:
+                continue
+            node_index[node_id] = make_node_dataset_urn(
+                platform,
+                env,
+                node.get('database', ''),
+                node.get('schema', ''),
+                node.get(identifier_key) or node.get('name'),
+            )
+            if len(node_index) == len(node_ids):
+                break
+    return node_index
+
+
+@dataclass(slots=True, frozen=True)
 class DBTMetric:
-    """Represents a dbt metric from manifest.json"""
+    """Represents a dbt metric from manifest.json (slotted to keep per-metric memory small)"""
     name: str
     unique_id: str
     description: Optional[str]
@@ -64,14 +220,14 @@ class DBTMetric:
     filters: List[Dict]
     dimensions: List[str]
     time_grains: List[str]
-    depends_on: List[str]  # models, sources this metric depends on
+    depends_on: Tuple[str, ...]  # models, sources this metric depends on
     meta: Dict
     tags: List[str]
     package_name: str
     path: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DBTSemanticModel:
     """Represents a dbt semantic model (dbt 1.6+)"""
     name: str
@@ -94,90 +250,303 @@ class DBTMetricsIngestion:
         platform: str = "dbt",
         env: str = "PROD",
         glossary_root: str = "dbt_metrics",
-        dry_run: bool = False
+        dry_run: bool = False,
+        workers: int = DEFAULT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        state_file: Optional[str] = None,
+        compress: bool = True
     ):
         self.dry_run = dry_run
+        self.gms_server = normalize_gms_url(datahub_url)
+        self.compress = compress
         if not dry_run:
-            self.emitter = DatahubRestEmitter(
-                gms_server=datahub_url,
-                token=token
-            )
+            self.session = self.create_session(token, pool_size=workers, compress=compress)
         else:
-            self.emitter = None
+            self.session = None
             logger.info("DRY RUN MODE - No data will be emitted to DataHub")
         self.platform = platform
         self.env = env
         self.glossary_root = glossary_root
+        # URN prefixes under the root, built once so per-category/per-term URNs are plain concatenation
+        self._node_prefix = make_glossary_node_urn(f"{glossary_root}.")
+        self._term_prefix = f"urn:li:glossaryTerm:{glossary_root}."
+        self.workers = workers
+        self.batch_size = batch_size
+        self.state_file = state_file
+        # "<entity urn>/<aspect name>" -> aspect hash as of the last successful emission
+        self._state: Optional[Dict[str, str]] = None
+        self._state_lock = threading.Lock()
+        self._skipped = 0
+        # (MCP, aspect hash) pairs waiting to be sent, and batches already handed to the executor
+        self._pending: List[Tuple[MetadataChangeProposalWrapper, Optional[str]]] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._batch_futures: List[Future] = []
+        # URNs (or, for terms that could not be built, metric IDs) that never made it into DataHub
+        self._failed: List[str] = []
+        self._failed_lock = threading.Lock()
+        # Lookup tables precomputed once per run so the per-metric path is plain dict hits
+        self._node_index: Dict[str, str] = {}
+        self._category_urn_by_raw: Dict[str, Tuple[str, str]] = {}
+        # One staging model typically feeds many metrics, so memoize per dependency list
+        self.format_upstream_datasets = functools.lru_cache(maxsize=None)(self.format_upstream_datasets)
+
+    @staticmethod
+    def create_session(token: Optional[str], pool_size: int, compress: bool = True) -> requests.Session:
+        """Create a keep-alive HTTP session for GMS, shared by all worker threads.
+
+        The connection pool is sized for the workers so every in-flight batch reuses a
+        connection instead of paying a new TCP/TLS handshake.
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({'POST'}),
+            # Hand the final response back so raise_for_status reports the real status
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update({
+            'X-RestLi-Protocol-Version': '2.0.0',
+            'Content-Type': 'application/json',
+        })
+        if token:
+            session.headers['Authorization'] = f"Bearer {token}"
+        if compress:
+            # Every request this session makes is a batch POST, and emit_batch gzips all of them
+            session.headers['Content-Encoding'] = 'gzip'
+        return session
+
+    def load_state(self) -> Dict[str, str]:
+        """Load aspect hashes recorded by the last run against the same GMS server"""
+        try:
+            with open(self.state_file, 'rb') as f:
+                state = orjson.loads(f.read())
+        except FileNotFoundError:
+            return {}
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"State file {self.state_file} is not valid JSON ({e}), ignoring it")
+            return {}
+
+        if not isinstance(state, dict) or not isinstance(state.get('aspects'), dict):
+            logger.warning(f"State file {self.state_file} is not a state file written by this script, ignoring it")
+            return {}
+        if state.get('gms_server') != self.gms_server:
+            logger.info(f"State file {self.state_file} was written for another DataHub server, ignoring it")
+            return {}
+        return state['aspects']
+
+    def save_state(self):
+        """Persist aspect hashes, replacing the state file atomically"""
+        tmp_path = f"{self.state_file}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({'gms_server': self.gms_server, 'aspects': self._state}))
+        os.replace(tmp_path, self.state_file)
 
     def emit(self, mcpw):
-        """Emit metadata change proposal (or skip in dry-run mode)"""
+        """Queue metadata change proposal for batched emission (or skip in dry-run mode).
+
+        With a state file, aspects identical to the last successful run are skipped.
+        """
+        digest = None
+        if self._state is not None:
+            digest = aspect_digest(mcpw)
+            if self._state.get(f"{mcpw.entityUrn}/{mcpw.aspectName}") == digest:
+                self._skipped += 1
+                logger.debug("Skipping unchanged %s", mcpw.entityUrn)
+                return
+
         if self.dry_run:
-            logger.debug(f"[DRY RUN] Would emit: {mcpw.entityUrn}")
-        else:
-            self.emitter.emit_mcp(mcpw)
+            logger.debug("[DRY RUN] Would emit: %s", mcpw.entityUrn)
+            return
 
-    def load_manifest(self, manifest_path: str) -> Dict:
-        """Load dbt manifest.json"""
-        logger.info(f"Loading manifest from {manifest_path}")
-        with open(manifest_path, 'r') as f:
-            return json.load(f)
+        self._pending.append((mcpw, digest))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
 
-    def parse_metrics(self, manifest: Dict) -> List[DBTMetric]:
-        """Extract metrics from manifest"""
-        metrics = []
+    def flush(self):
+        """Send queued MCPs as one batch, on the worker pool if one is running"""
+        if not self._pending:
+            return
 
-        for metric_id, metric_data in manifest.get('metrics', {}).items():
+        batch, self._pending = self._pending, []
+        if self._executor is not None:
+            self._batch_futures.append(self._executor.submit(self.emit_batch, batch))
+            # Bound in-flight batches so a slow GMS doesn't buffer the whole streamed manifest
+            if len(self._batch_futures) >= 2 * self.workers:
+                self.wait_for_batches(return_when=FIRST_COMPLETED)
+        else:
+            self.emit_batch(batch)
+
+    def wait_for_batches(self, return_when: str = ALL_COMPLETED):
+        """Wait for in-flight batches; emit_batch has already logged and recorded any that failed"""
+        _, not_done = wait(self._batch_futures, return_when=return_when)
+        self._batch_futures = list(not_done)
+
+    def emit_batch(self, batch: List[Tuple[MetadataChangeProposalWrapper, Optional[str]]]):
+        """POST a batch of MCPs to the GMS ingestProposalBatch endpoint.
+
+        Like the SDK emitter, a batch that would exceed GMS's payload size or MCP count limit is split
+        across requests.
+        """
+        start = size = 0
+        try:
+            proposals = [orjson.dumps(pre_json_transform(mcpw.to_obj()), default=float) for mcpw, _ in batch]
+
+            for i, proposal in enumerate(proposals):
+                if i > start and (
+                    size + len(proposal) > INGEST_MAX_PAYLOAD_BYTES
+                    or i - start >= BATCH_INGEST_MAX_PAYLOAD_LENGTH
+                ):
+                    self.post_proposals(batch[start:i], proposals[start:i])
+                    start, size = i, 0
+                size += len(proposal) + 1
+            self.post_proposals(batch[start:], proposals[start:])
+        except Exception as e:
+            # Requests already accepted stay ingested; everything from the failed one on is lost
+            failed = [mcpw.entityUrn for mcpw, _ in batch[start:]]
+            with self._failed_lock:
+                self._failed.extend(failed)
+            logger.error(f"Failed to emit batch of {len(failed)} MCPs ({', '.join(failed)}): {e}")
+            raise
+
+    def post_proposals(
+        self,
+        batch: List[Tuple[MetadataChangeProposalWrapper, Optional[str]]],
+        proposals: List[bytes]
+    ):
+        """Send one ingestProposalBatch request from already serialized proposals"""
+        payload = b'{"proposals":[' + b','.join(proposals) + b']}'
+        if self.compress:
+            payload = gzip.compress(payload, compresslevel=GZIP_COMPRESSLEVEL)
+        response = self.session.post(
+            f"{self.gms_server}/aspects?action=ingestProposalBatch",
+            data=payload,
+            timeout=REQUEST_TIMEOUT_SEC
+        )
+        if not response.ok:
+            raise requests.HTTPError(
+                f"{response.status_code} from DataHub GMS: {gms_error_message(response)}",
+                response=response
+            )
+        logger.debug("Emitted batch of %d MCPs", len(batch))
+
+        # Only record hashes once GMS has accepted the batch
+        if self._state is not None:
+            with self._state_lock:
+                for mcpw, digest in batch:
+                    self._state[f"{mcpw.entityUrn}/{mcpw.aspectName}"] = digest
+
+    def iter_manifest_section(
+        self,
+        manifest_path: str,
+        section: str
+    ) -> Iterator[Tuple[str, Dict]]:
+        """Stream (id, object) pairs from a top-level manifest section without loading the whole file"""
+        with open(manifest_path, 'rb') as f:
+            yield from ijson.kvitems(f, section)
+
+    def load_node_index(self, manifest_path: str, node_ids: Set[str]) -> Dict[str, str]:
+        """Build a node_id -> dataset URN index for the given manifest nodes and sources.
+
+        Each ID is only looked up in the section its resource type lives in, so a section nothing
+        depends on is never parsed. Large manifests on a multi-CPU host with fork parse sections in
+        parallel processes; spawned children would re-import the whole SDK, so they are never used.
+        """
+        logger.info(f"Indexing {len(node_ids)} nodes and sources referenced by metrics")
+        jobs = []
+        for section, identifier_key, resource_types in NODE_SECTIONS:
+            section_ids = {node_id for node_id in node_ids if node_id.startswith(resource_types)}
+            if section_ids:
+                jobs.append((manifest_path, section, identifier_key, self.platform, self.env, section_ids))
+
+        node_index = {}
+        processes = min(len(jobs), os.cpu_count() or 1)
+        if (
+            processes <= 1
+            or 'fork' not in multiprocessing.get_all_start_methods()
+            or os.path.getsize(manifest_path) < PARALLEL_INDEX_MIN_BYTES
+        ):
+            for job in jobs:
+                node_index.update(build_node_urn_index(*job))
+            return node_index
+
+        mp_context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context) as pool:
+            for section_index in pool.map(build_node_urn_index, *zip(*jobs)):
+                node_index.update(section_index)
+
+        return node_index
+
+    def parse_metrics(self, manifest_path: str) -> Iterator[DBTMetric]:
+        """Stream metrics from manifest"""
+        count = 0
+
+        for metric_id, metric_data in self.iter_manifest_section(manifest_path, 'metrics'):
+            # Bind the getter once; this runs for every metric in the manifest
+            get = metric_data.get
             metric = DBTMetric(
-                name=metric_data.get('name'),
+                name=get('name'),
                 unique_id=metric_id,
-                description=metric_data.get('description', ''),
-                label=metric_data.get('label'),
-                type=metric_data.get('type'),
-                calculation_method=metric_data.get('calculation_method'),
-                expression=metric_data.get('expression'),
-                filters=metric_data.get('filters', []),
-                dimensions=metric_data.get('dimensions', []),
-                time_grains=metric_data.get('time_grains', []),
-                depends_on=metric_data.get('depends_on', {}).get('nodes', []),
-                meta=metric_data.get('meta', {}),
-                tags=metric_data.get('tags', []),
-                package_name=metric_data.get('package_name', ''),
-                path=metric_data.get('path', '')
+                description=get('description', ''),
+                label=get('label'),
+                type=get('type'),
+                calculation_method=get('calculation_method'),
+                expression=get('expression'),
+                filters=get('filters', []),
+                dimensions=get('dimensions', []),
+                time_grains=get('time_grains', []),
+                depends_on=tuple(get('depends_on', {}).get('nodes', [])),
+                # meta values are rendered with str(), where a Decimal would leak through
+                meta=_floats_from_decimals(get('meta', {})),
+                tags=get('tags', []),
+                package_name=get('package_name', ''),
+                path=get('path', '')
             )
-            metrics.append(metric)
+            count += 1
+            yield metric
 
-        logger.info(f"Found {len(metrics)} metrics in manifest")
-        return metrics
+        logger.info(f"Found {count} metrics in manifest")
 
-    def parse_semantic_models(self, manifest: Dict) -> List[DBTSemanticModel]:
-        """Extract semantic models from manifest (dbt 1.6+)"""
-        semantic_models = []
+    def parse_semantic_models(self, manifest_path: str) -> Iterator[DBTSemanticModel]:
+        """Stream semantic models from manifest (dbt 1.6+)"""
+        count = 0
 
-        for sm_id, sm_data in manifest.get('semantic_models', {}).items():
+        for sm_id, sm_data in self.iter_manifest_section(manifest_path, 'semantic_models'):
+            get = sm_data.get
             sm = DBTSemanticModel(
-                name=sm_data.get('name'),
+                name=get('name'),
                 unique_id=sm_id,
-                description=sm_data.get('description', ''),
-                model=sm_data.get('model'),
-                dimensions=sm_data.get('dimensions', []),
-                measures=sm_data.get('measures', []),
-                entities=sm_data.get('entities', []),
-                meta=sm_data.get('meta', {})
+                description=get('description', ''),
+                model=get('model'),
+                dimensions=get('dimensions', []),
+                measures=get('measures', []),
+                entities=get('entities', []),
+                meta=get('meta', {})
             )
-            semantic_models.append(sm)
+            count += 1
+            yield sm
 
-        logger.info(f"Found {len(semantic_models)} semantic models in manifest")
-        return semantic_models
+        logger.info(f"Found {count} semantic models in manifest")
 
-    def create_glossary_hierarchy(self, metrics: List[DBTMetric]) -> Dict[str, str]:
-        """Create glossary nodes for organizing metrics. Returns dict of category -> node URN"""
-        categories = {}
+    def scan_metrics(self, metrics: List[DBTMetric]) -> Tuple[List[str], Set[str]]:
+        """Collect unique metric categories (in first-seen order) and every node metrics depend on"""
+        # Unique categories from meta tags (or default), in first-seen order
+        categories = dict.fromkeys(
+            metric.meta.get('datahub_glossary_category', 'Uncategorized') for metric in metrics
+        )
+        node_ids = {node_id for metric in metrics for node_id in metric.depends_on}
+
+        return list(categories), node_ids
 
-        for metric in metrics:
-            # Extract category from meta tags or use default
-            category = metric.meta.get('datahub_glossary_category', 'Uncategorized')
-            categories[category] = None  # Will be filled with URN
+    def create_glossary_hierarchy(self, unique_categories: Iterable[str]) -> Dict[str, str]:
+        """Create glossary nodes for organizing metrics. Returns dict of category -> node URN.
 
+        Also records each category's node URN and term URN prefix for emit_metric_as_glossary_term.
+        """
         # Create root glossary node
         root_urn = make_glossary_node_urn(self.glossary_root)
         root_info = GlossaryNodeInfoClass(
@@ -193,13 +562,14 @@ class DBTMetricsIngestion:
         logger.info(f"Created glossary root node: {self.glossary_root}")
 
         # Create category nodes
-        for category in categories.keys():
+        categories = {}
+        for category in unique_categories:
             # Handle nested categories (e.g., "Finance/Revenue")
             category_path = category.replace('/', '.')
-            category_urn = make_glossary_node_urn(f"{self.glossary_root}.{category_path}")
+            category_urn = self._node_prefix + category_path
             category_info = GlossaryNodeInfoClass(
                 definition=f"Metrics in category: {category}",
-                name=category.split('/')[-1],  # Use last part as display name
+                name=category.rpartition('/')[2],  # Use last part as display name
                 parentNode=root_urn
             )
 
@@ -208,63 +578,38 @@ class DBTMetricsIngestion:
                 aspect=category_info
             )
             self.emit(mcpw)
-            logger.info(f"Created glossary category node: {category}")
+            logger.debug("Created glossary category node: %s", category)
 
             # Store URN for later reference
             categories[category] = category_urn
+            self._category_urn_by_raw[category] = (category_urn, self._term_prefix + category_path + '.')
 
+        logger.info(f"Created {len(categories)} glossary category nodes")
         return categories
 
-    def resolve_node_to_dataset_urn(
-        self,
-        node_id: str,
-        manifest: Dict
-    ) -> Optional[str]:
-        """Resolve a dbt node ID to a DataHub dataset URN"""
-        # Check if it's a model
-        if node_id in manifest.get('nodes', {}):
-            node = manifest['nodes'][node_id]
-            database = node.get('database', '')
-            schema = node.get('schema', '')
-            identifier = node.get('alias') or node.get('name')
-
-            # Build dataset name: database.schema.table
-            dataset_name = f"{database}.{schema}.{identifier}".lower()
-            return make_dataset_urn(
-                platform=self.platform,
-                name=dataset_name,
-                env=self.env
-            )
-
-        # Check if it's a source
-        if node_id in manifest.get('sources', {}):
-            source = manifest['sources'][node_id]
-            source_database = source.get('database', '')
-            source_schema = source.get('schema', '')
-            source_identifier = source.get('identifier') or source.get('name')
-
-            dataset_name = f"{source_database}.{source_schema}.{source_identifier}".lower()
-            return make_dataset_urn(
-                platform=self.platform,
-                name=dataset_name,
-                env=self.env
-            )
-
-        logger.warning(f"Could not resolve node {node_id} to dataset URN")
-        return None
-
-    def emit_metric_as_glossary_term(
-        self,
-        metric: DBTMetric,
-        manifest: Dict,
-        category_urns: Dict[str, str]
-    ) -> str:
+    def resolve_node_to_dataset_urn(self, node_id: str) -> Optional[str]:
+        """Resolve a dbt node ID (model or source) to a DataHub dataset URN"""
+        dataset_urn = self._node_index.get(node_id)
+        if dataset_urn is None:
+            logger.warning(f"Could not resolve node {node_id} to dataset URN")
+        return dataset_urn
+
+    def format_upstream_datasets(self, depends_on: Tuple[str, ...]) -> str:
+        """Resolve metric dependencies to a comma-separated list of dataset URNs"""
+        # One hash per dependency against the combined nodes+sources index
+        upstream_urns = [urn for urn in map(self._node_index.get, depends_on) if urn]
+        if len(upstream_urns) != len(depends_on):
+            # Only the rare unresolved case pays for the per-node lookup and warning
+            for dep in depends_on:
+                self.resolve_node_to_dataset_urn(dep)
+        return ', '.join(upstream_urns)
+
+    def emit_metric_as_glossary_term(self, metric: DBTMetric) -> str:
         """Emit a single metric as a GlossaryTerm"""
-        # Determine category
+        # Determine category and its precomputed parent node / term URN prefix
         category = metric.meta.get('datahub_glossary_category', 'Uncategorized')
-        category_path = category.replace('/', '.')
-        term_name = f"{self.glossary_root}.{category_path}.{metric.name}"
-        term_urn = make_term_urn(term_name)
+        parent_node_urn, term_urn_prefix = self._category_urn_by_raw[category]
+        term_urn = term_urn_prefix + metric.name
 
         # Build custom properties
         custom_props = {
@@ -273,38 +618,23 @@ class DBTMetricsIngestion:
             'dbt_path': metric.path,
         }
 
-        if metric.type:
-            custom_props['metric_type'] = metric.type
-        if metric.calculation_method:
-            custom_props['calculation_method'] = metric.calculation_method
-        if metric.expression:
-            custom_props['expression'] = metric.expression
-        if metric.dimensions:
-            custom_props['dimensions'] = ', '.join(metric.dimensions)
-        if metric.time_grains:
-            custom_props['time_grains'] = ', '.join(metric.time_grains)
-        if metric.filters:
-            custom_props['filters'] = json.dumps(metric.filters)
-        if metric.tags:
-            custom_props['tags'] = ', '.join(metric.tags)
+        for prop, attr, formatter in METRIC_CUSTOM_PROPERTIES:
+            value = getattr(metric, attr)
+            if value:
+                custom_props[prop] = formatter(value)
 
         # Add upstream dataset lineage (as custom property since GlossaryTerms don't support upstreamLineage)
         if metric.depends_on:
-            upstream_urns = []
-            for dep in metric.depends_on:
-                dataset_urn = self.resolve_node_to_dataset_urn(dep, manifest)
-                if dataset_urn:
-                    upstream_urns.append(dataset_urn)
-            if upstream_urns:
-                custom_props['upstream_datasets'] = ', '.join(upstream_urns)
+            upstream_datasets = self.format_upstream_datasets(metric.depends_on)
+            if upstream_datasets:
+                custom_props['upstream_datasets'] = upstream_datasets
 
         # Add any custom meta properties
-        for key, value in metric.meta.items():
-            if key not in ['datahub_glossary_category']:
-                custom_props[f'meta_{key}'] = str(value)
-
-        # Get parent node URN for this category
-        parent_node_urn = category_urns.get(category)
+        custom_props.update({
+            f'meta_{key}': str(value)
+            for key, value in metric.meta.items()
+            if key != 'datahub_glossary_category'
+        })
 
         # Create GlossaryTermInfo with parentNode link
         term_info = GlossaryTermInfoClass(
@@ -324,9 +654,9 @@ class DBTMetricsIngestion:
         # Note: GlossaryTerms don't support globalTags aspect
         # Tags are stored in customProperties instead
         if metric.tags:
-            logger.debug(f"Tags for metric '{metric.name}': {metric.tags} (stored in customProperties)")
+            logger.debug("Tags for metric '%s': %s (stored in customProperties)", metric.name, metric.tags)
 
-        logger.info(f"Emitted metric '{metric.name}' as GlossaryTerm: {term_urn}")
+        logger.debug("Emitted metric '%s' as GlossaryTerm: %s", metric.name, term_urn)
 
         # Note: GlossaryTerms don't support upstreamLineage aspect
         # Lineage info is already stored in customProperties above
@@ -334,31 +664,77 @@ class DBTMetricsIngestion:
 
         return term_urn
 
-    def ingest_metrics(self, manifest_path: str):
-        """Main ingestion flow"""
+    def ingest_metrics(self, manifest_path: str) -> bool:
+        """Main ingestion flow. Returns False if any glossary node or term failed to ingest."""
         logger.info("Starting dbt metrics ingestion...")
 
-        # Load manifest
-        manifest = self.load_manifest(manifest_path)
+        if self.state_file:
+            self._state = self.load_state()
+            logger.info(f"Loaded {len(self._state)} previously emitted aspects from {self.state_file}")
 
-        # Parse metrics
-        metrics = self.parse_metrics(manifest)
+        logger.info(f"Loading manifest from {manifest_path}")
+
+        # Every pass tokenizes the manifest, so the metrics section is read once and kept; it is
+        # a small fraction of a manifest dominated by nodes and macros
+        metrics = list(self.parse_metrics(manifest_path))
 
         if not metrics:
             logger.warning("No metrics found in manifest. Exiting.")
-            return
+            return True
+
+        categories, node_ids = self.scan_metrics(metrics)
 
-        # Create glossary hierarchy (returns dict of category -> URN)
-        category_urns = self.create_glossary_hierarchy(metrics)
+        # Only dataset URNs of referenced nodes/sources are kept, resolved once per node
+        self._node_index = self.load_node_index(manifest_path, node_ids)
+        self.format_upstream_datasets.cache_clear()
 
-        # Emit each metric
-        for metric in metrics:
+        # Create glossary hierarchy (returns dict of category -> URN).
+        # Sent synchronously so parent nodes exist first and connection problems fail fast.
+        self.create_glossary_hierarchy(categories)
+        self.flush()
+
+        # Each metric is built into a term and queued; full batches are POSTed
+        # concurrently by the worker pool
+        ingested = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            self._executor = executor
             try:
-                self.emit_metric_as_glossary_term(metric, manifest, category_urns)
-            except Exception as e:
-                logger.error(f"Failed to emit metric '{metric.name}': {e}")
+                for metric in metrics:
+                    ingested += 1
+                    try:
+                        self.emit_metric_as_glossary_term(metric)
+                    except Exception as e:
+                        self._failed.append(metric.unique_id)
+                        logger.error(f"Failed to emit metric '{metric.name}': {e}")
+                    if ingested % PROGRESS_LOG_INTERVAL == 0:
+                        logger.info(f"Processed {ingested} metrics...")
+                self.flush()
+            finally:
+                self._executor = None
+            self.wait_for_batches()
+
+        if self._state is not None:
+            logger.info(f"Skipped {self._skipped} unchanged glossary nodes and terms")
+            if not self.dry_run:
+                self.save_state()
+
+        if self._failed:
+            logger.error(
+                f"❌ {len(self._failed)} glossary nodes and terms were not ingested "
+                f"({ingested} metrics processed); see the errors above"
+            )
+            return False
+
+        logger.info(f"✅ Successfully ingested {ingested} metrics into DataHub!")
+        return True
 
-        logger.info(f"✅ Successfully ingested {len(metrics)} metrics into DataHub!")
+
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 
 def main():
@@ -399,9 +775,41 @@ def main():
         action='store_true',
         help='Parse and validate without emitting to DataHub'
     )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log every glossary node and term as it is emitted'
+    )
+    parser.add_argument(
+        '--workers',
+        type=positive_int,
+        default=DEFAULT_WORKERS,
+        help=f'Number of concurrent emitter threads (default: {DEFAULT_WORKERS})'
+    )
+    parser.add_argument(
+        '--batch-size',
+        type=positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            f'Number of MCPs sent per request to DataHub, at most {BATCH_INGEST_MAX_PAYLOAD_LENGTH} '
+            f'(default: {DEFAULT_BATCH_SIZE})'
+        )
+    )
+    parser.add_argument(
+        '--no-compression',
+        action='store_true',
+        help='Send request bodies to DataHub uncompressed instead of gzipped'
+    )
+    parser.add_argument(
+        '--state-file',
+        help='JSON file recording what was emitted; later runs skip unchanged metrics'
+    )
 
     args = parser.parse_args()
 
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
     # Create ingestion instance
     ingestion = DBTMetricsIngestion(
         datahub_url=args.datahub_url,
@@ -409,11 +817,16 @@ def main():
         platform=args.platform,
         env=args.env,
         glossary_root=args.glossary_root,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        state_file=args.state_file,
+        compress=not args.no_compression
     )
 
     # Run ingestion
-    ingestion.ingest_metrics(args.manifest)
+    if not ingestion.ingest_metrics(args.manifest):
+        sys.exit(1)
 
 
 if __name__ == '__main__':